@@ -4,6 +4,6 @@ watsonx.data API client module.
 This file has been modified with the assistance of IBM Bob AI tool
 """
 
-from lakehouse_mcp.client.watsonx import WatsonXClient
+from lakehouse_mcp.client.watsonx import WatsonXClient, close_client, get_client
 
-__all__ = ["WatsonXClient"]
+__all__ = ["WatsonXClient", "close_client", "get_client"]
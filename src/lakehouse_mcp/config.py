@@ -45,6 +45,52 @@ class WatsonXConfig(BaseSettings):
         default=False,
         description="Skip TLS certificate verification (dev/test only)",
     )
+    http2_enabled: bool = Field(
+        default=True,
+        description="Use HTTP/2 so concurrent requests share one TLS connection",
+    )
+    max_connections: int = Field(
+        default=200,
+        description="Maximum number of concurrent HTTP connections",
+        ge=1,
+    )
+    max_keepalive_connections: int = Field(
+        default=50,
+        description="Maximum number of idle keep-alive connections kept in the pool",
+        ge=0,
+    )
+    keepalive_expiry_seconds: float = Field(
+        default=30.0,
+        description="Seconds an idle keep-alive connection is kept open",
+        ge=0,
+    )
+    read_cache_ttl_seconds: float = Field(
+        default=3.0,
+        description="Seconds a cached catalog/ingestion read stays valid (0 disables the cache)",
+        ge=0,
+        le=60,
+    )
+    read_cache_max_entries: int = Field(
+        default=256,
+        description="Maximum number of cached read responses",
+        ge=1,
+    )
+    retry_max_attempts: int = Field(
+        default=3,
+        description="Maximum attempts for GET requests that fail with 502/503/504 or a network error",
+        ge=1,
+        le=10,
+    )
+    circuit_failure_threshold: int = Field(
+        default=5,
+        description="Consecutive failed requests (each counted once, after its retries) after which requests fail fast",
+        ge=1,
+    )
+    circuit_reset_seconds: float = Field(
+        default=30.0,
+        description="Seconds the circuit stays open before a single probe request is let through",
+        ge=0,
+    )
 
 
 class ServerConfig(BaseSettings):
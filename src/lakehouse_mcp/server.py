@@ -6,15 +6,38 @@ This module sets up the FastMCP server with tools and dependencies.
 This file has been modified with the assistance of IBM Bob AI tool
 """
 
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any
+
 import fastmcp
 
-from lakehouse_mcp.client import WatsonXClient
+from lakehouse_mcp.client import close_client, get_client
 from lakehouse_mcp.config import Config
 from lakehouse_mcp.observability import get_logger, get_meter, setup_observability
 
 logger = get_logger(__name__)
 
 
+@asynccontextmanager
+async def lifespan(server: fastmcp.FastMCP) -> AsyncIterator[dict[str, Any]]:
+    """Manage the shared WatsonX client for the lifetime of the server.
+
+    Args:
+        server: FastMCP server instance
+
+    Yields:
+        Empty lifespan state
+    """
+    # Re-attach in case a previous run of the server closed the client
+    server.watsonx_client = get_client(server.config.watsonx)
+    try:
+        yield {}
+    finally:
+        await close_client()
+        logger.debug("watsonx_client_closed")
+
+
 def create_server(config: Config) -> fastmcp.FastMCP:
     """Create and configure the FastMCP server.
 
@@ -37,10 +60,11 @@ def create_server(config: Config) -> fastmcp.FastMCP:
     mcp = fastmcp.FastMCP(
         name="IBMWatsonxDataMCPServer",
         version="0.1.0",
+        lifespan=lifespan,
     )
 
-    # Create WatsonX client (will be passed as dependency to tools)
-    watsonx_client = WatsonXClient(config.watsonx)
+    # Shared WatsonX client (will be passed as dependency to tools)
+    watsonx_client = get_client(config.watsonx)
 
     # Create metrics tracker
     meter = get_meter(__name__)
@@ -34,6 +34,7 @@ from lakehouse_mcp.tools.engine import (
 from lakehouse_mcp.tools.ingestion import (
     cancel_ingestion_job,
     create_ingestion_job,
+    create_ingestion_jobs,
     get_ingestion_job,
     list_ingestion_jobs,
 )
@@ -56,6 +57,7 @@ __all__ = [
     "add_columns",
     "cancel_ingestion_job",
     "create_ingestion_job",
+    "create_ingestion_jobs",
     "create_presto_engine",
     "create_schema",
     "create_spark_engine",
@@ -45,7 +45,7 @@ async def add_columns(
     """
     watsonx_client = ctx.fastmcp.watsonx_client
 
-    logger.info(
+    logger.debug(
         "adding_columns",
         catalog_name=catalog_name,
         schema_name=schema_name,
@@ -64,7 +64,7 @@ async def create_schema(
             "status_code": 400,
         }
 
-    logger.info(
+    logger.debug(
         "creating_schema",
         catalog_id=catalog_id,
         schema_name=schema_name,
@@ -49,7 +49,7 @@ async def describe_table(
     """
     watsonx_client = ctx.fastmcp.watsonx_client
 
-    logger.info(
+    logger.debug(
         "describing_table",
         catalog_name=catalog_name,
         schema_name=schema_name,
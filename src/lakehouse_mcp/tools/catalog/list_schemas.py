@@ -36,7 +36,7 @@ async def list_schemas(
     """
     watsonx_client = ctx.fastmcp.watsonx_client
 
-    logger.info(
+    logger.debug(
         "listing_schemas",
         catalog_name=catalog_name,
         engine_id=engine_id,
@@ -45,8 +45,8 @@ async def list_schemas(
     # Build API path: /v3/catalogs/{catalog_name}/schemas?engine_id={engine_id}
     path = f"/v3/catalogs/{catalog_name}/schemas?engine_id={engine_id}"
 
-    # Make API call
-    response = await watsonx_client.get(path)
+    # Make API call (catalog listings may be served from the short-lived read cache)
+    response = await watsonx_client.get(path, cache=True)
 
     # Handle None response
     response = response or {}
@@ -38,7 +38,7 @@ async def list_tables(
     """
     watsonx_client = ctx.fastmcp.watsonx_client
 
-    logger.info(
+    logger.debug(
         "listing_tables",
         catalog_name=catalog_name,
         schema_name=schema_name,
@@ -48,8 +48,8 @@ async def list_tables(
     # Build API path: /v3/catalogs/{catalog}/schemas/{schema}/tables?engine_id={engine_id}
     path = f"/v3/catalogs/{catalog_name}/schemas/{schema_name}/tables?engine_id={engine_id}"
 
-    # Make API call
-    response = await watsonx_client.get(path)
+    # Make API call (catalog listings may be served from the short-lived read cache)
+    response = await watsonx_client.get(path, cache=True)
 
     # Handle None response
     response = response or {}
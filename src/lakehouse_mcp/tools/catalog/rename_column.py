@@ -41,7 +41,7 @@ async def rename_column(
     """
     watsonx_client = ctx.fastmcp.watsonx_client
 
-    logger.info(
+    logger.debug(
         "renaming_column",
         catalog_name=catalog_name,
         schema_name=schema_name,
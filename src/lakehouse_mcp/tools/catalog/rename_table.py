@@ -39,7 +39,7 @@ async def rename_table(
     """
     watsonx_client = ctx.fastmcp.watsonx_client
 
-    logger.info(
+    logger.debug(
         "renaming_table",
         catalog_name=catalog_name,
         schema_name=schema_name,
@@ -147,7 +147,7 @@ async def create_prestissimo_engine(
     if tags is not None:
         body["tags"] = tags
 
-    logger.info("creating_prestissimo_engine", display_name=display_name, origin=origin)
+    logger.debug("creating_prestissimo_engine", display_name=display_name, origin=origin)
 
     path = "/v3/prestissimo_engines"
     response = await watsonx_client.post(path, body)
@@ -260,7 +260,7 @@ async def create_presto_engine(
     if tags is not None:
         body["tags"] = tags
 
-    logger.info("creating_presto_engine", display_name=display_name, origin=origin)
+    logger.debug("creating_presto_engine", display_name=display_name, origin=origin)
 
     path = "/v3/presto_engines"
     response = await watsonx_client.post(path, body)
@@ -71,7 +71,7 @@ async def create_spark_engine(
     if tags is not None:
         body["tags"] = tags
 
-    logger.info("creating_spark_engine", display_name=display_name, origin=origin)
+    logger.debug("creating_spark_engine", display_name=display_name, origin=origin)
 
     path = "/v3/spark_engines"
     response = await watsonx_client.post(path, body)
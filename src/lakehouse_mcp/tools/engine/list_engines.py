@@ -40,7 +40,7 @@ async def list_engines(ctx: Context, engine_type: str | None = None) -> dict[str
             "status_code": 400,
         }
 
-    logger.info("listing_engines", engine_type=engine_type)
+    logger.debug("listing_engines", engine_type=engine_type)
 
     # Determine which API calls to make
     should_fetch_presto = engine_type is None or engine_type == "presto"
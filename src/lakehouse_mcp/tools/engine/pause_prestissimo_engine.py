@@ -28,7 +28,7 @@ async def pause_prestissimo_engine(ctx: Context, engine_id: str) -> dict[str, An
     """
     watsonx_client = ctx.fastmcp.watsonx_client
 
-    logger.info("pausing_prestissimo_engine", engine_id=engine_id)
+    logger.debug("pausing_prestissimo_engine", engine_id=engine_id)
 
     # Pause the engine (empty POST request)
     path = f"/v3/prestissimo_engines/{engine_id}/pause"
@@ -28,7 +28,7 @@ async def pause_presto_engine(ctx: Context, engine_id: str) -> dict[str, Any]:
     """
     watsonx_client = ctx.fastmcp.watsonx_client
 
-    logger.info("pausing_presto_engine", engine_id=engine_id)
+    logger.debug("pausing_presto_engine", engine_id=engine_id)
 
     # Pause the engine (empty POST request)
     path = f"/v3/presto_engines/{engine_id}/pause"
@@ -33,7 +33,7 @@ async def pause_spark_engine(
     """
     watsonx_client = ctx.fastmcp.watsonx_client
 
-    logger.info("pausing_spark_engine", engine_id=engine_id, force=force)
+    logger.debug("pausing_spark_engine", engine_id=engine_id, force=force)
 
     # Build request body
     body = {"force": force}
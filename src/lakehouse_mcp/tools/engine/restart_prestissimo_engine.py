@@ -28,7 +28,7 @@ async def restart_prestissimo_engine(ctx: Context, engine_id: str) -> dict[str,
     """
     watsonx_client = ctx.fastmcp.watsonx_client
 
-    logger.info("restarting_prestissimo_engine", engine_id=engine_id)
+    logger.debug("restarting_prestissimo_engine", engine_id=engine_id)
 
     path = f"/v3/prestissimo_engines/{engine_id}/restart"
     response = await watsonx_client.post(path, {})
@@ -28,7 +28,7 @@ async def restart_presto_engine(ctx: Context, engine_id: str) -> dict[str, Any]:
     """
     watsonx_client = ctx.fastmcp.watsonx_client
 
-    logger.info("restarting_presto_engine", engine_id=engine_id)
+    logger.debug("restarting_presto_engine", engine_id=engine_id)
 
     path = f"/v3/presto_engines/{engine_id}/restart"
     response = await watsonx_client.post(path, {})
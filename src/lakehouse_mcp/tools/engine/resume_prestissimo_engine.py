@@ -28,7 +28,7 @@ async def resume_prestissimo_engine(ctx: Context, engine_id: str) -> dict[str, A
     """
     watsonx_client = ctx.fastmcp.watsonx_client
 
-    logger.info("resuming_prestissimo_engine", engine_id=engine_id)
+    logger.debug("resuming_prestissimo_engine", engine_id=engine_id)
 
     # Resume the engine (empty POST request)
     path = f"/v3/prestissimo_engines/{engine_id}/resume"
@@ -28,7 +28,7 @@ async def resume_presto_engine(ctx: Context, engine_id: str) -> dict[str, Any]:
     """
     watsonx_client = ctx.fastmcp.watsonx_client
 
-    logger.info("resuming_presto_engine", engine_id=engine_id)
+    logger.debug("resuming_presto_engine", engine_id=engine_id)
 
     # Resume the engine (empty POST request)
     path = f"/v3/presto_engines/{engine_id}/resume"
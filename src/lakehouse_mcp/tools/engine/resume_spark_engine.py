@@ -28,7 +28,7 @@ async def resume_spark_engine(ctx: Context, engine_id: str) -> dict[str, Any]:
     """
     watsonx_client = ctx.fastmcp.watsonx_client
 
-    logger.info("resuming_spark_engine", engine_id=engine_id)
+    logger.debug("resuming_spark_engine", engine_id=engine_id)
 
     # Resume the engine (empty POST request)
     path = f"/v3/spark_engines/{engine_id}/resume"
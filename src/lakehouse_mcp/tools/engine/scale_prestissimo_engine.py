@@ -79,7 +79,7 @@ async def scale_prestissimo_engine(
         },
     }
 
-    logger.info(
+    logger.debug(
         "scaling_prestissimo_engine",
         engine_id=engine_id,
         coordinator=body.get("coordinator"),
@@ -79,7 +79,7 @@ async def scale_presto_engine(
         },
     }
 
-    logger.info(
+    logger.debug(
         "scaling_presto_engine",
         engine_id=engine_id,
         coordinator=body.get("coordinator"),
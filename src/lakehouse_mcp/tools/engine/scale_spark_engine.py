@@ -33,7 +33,7 @@ async def scale_spark_engine(
     """
     watsonx_client = ctx.fastmcp.watsonx_client
 
-    logger.info("scaling_spark_engine", engine_id=engine_id, number_of_nodes=number_of_nodes)
+    logger.debug("scaling_spark_engine", engine_id=engine_id, number_of_nodes=number_of_nodes)
 
     # Validate number_of_nodes
     if number_of_nodes < 1 or number_of_nodes > 1000:
@@ -64,7 +64,7 @@ async def update_prestissimo_engine(
     if tags is not None:
         body["tags"] = tags
 
-    logger.info(
+    logger.debug(
         "updating_prestissimo_engine",
         engine_id=engine_id,
         fields=list(body.keys()),
@@ -58,7 +58,7 @@ async def update_presto_engine(
     if tags is not None:
         body["tags"] = tags
 
-    logger.info(
+    logger.debug(
         "updating_presto_engine",
         engine_id=engine_id,
         fields=list(body.keys()),
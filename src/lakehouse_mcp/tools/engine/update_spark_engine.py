@@ -54,7 +54,7 @@ async def update_spark_engine(
     if tags is not None:
         body["tags"] = tags
 
-    logger.info(
+    logger.debug(
         "updating_spark_engine",
         engine_id=engine_id,
         fields=list(body.keys()),
@@ -8,12 +8,14 @@ This file has been modified with the assistance of IBM Bob AI tool
 
 from lakehouse_mcp.tools.ingestion.cancel_ingestion_job import cancel_ingestion_job
 from lakehouse_mcp.tools.ingestion.create_ingestion_job import create_ingestion_job
+from lakehouse_mcp.tools.ingestion.create_ingestion_jobs import create_ingestion_jobs
 from lakehouse_mcp.tools.ingestion.get_ingestion_job import get_ingestion_job
 from lakehouse_mcp.tools.ingestion.list_ingestion_jobs import list_ingestion_jobs
 
 __all__ = [
     "cancel_ingestion_job",
     "create_ingestion_job",
+    "create_ingestion_jobs",
     "get_ingestion_job",
     "list_ingestion_jobs",
 ]
\ No newline at end of file
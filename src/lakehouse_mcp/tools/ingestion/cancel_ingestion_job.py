@@ -13,6 +13,7 @@ from fastmcp import Context
 
 from lakehouse_mcp.observability import get_logger
 from lakehouse_mcp.server import mcp
+from lakehouse_mcp.tools.ingestion.paths import JOB_PATH_FMT
 
 logger = get_logger(__name__)
 
@@ -32,13 +33,12 @@ async def cancel_ingestion_job(
     """
     watsonx_client = ctx.fastmcp.watsonx_client
 
-    logger.info(
+    logger.debug(
         "cancelling_ingestion_job",
         job_id=job_id,
     )
 
-    path = f"/v3/lhingestion/api/v1/ingestion/jobs/{job_id}"
-    response = await watsonx_client.delete(path)
+    response = await watsonx_client.delete(JOB_PATH_FMT.format(job_id))
 
     # Check for API errors
     if response.get("error"):
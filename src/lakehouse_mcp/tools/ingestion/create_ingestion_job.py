@@ -10,13 +10,97 @@ from typing import Any
 
 import httpx
 from fastmcp import Context
+from pydantic import BaseModel, Field
 
 from lakehouse_mcp.observability import get_logger
 from lakehouse_mcp.server import mcp
+from lakehouse_mcp.tools.ingestion.paths import JOBS_PATH
 
 logger = get_logger(__name__)
 
 
+class IngestionJobSpec(BaseModel):
+    """Specification of one ingestion job; fields match create_ingestion_job's parameters."""
+
+    job_id: str = Field(description='Unique job identifier (e.g., "ingestion-1234567890")')
+    catalog: str = Field(description="Target catalog name")
+    schema_: str = Field(alias="schema", description="Target schema name")
+    table: str = Field(description="Target table name")
+    file_paths: str = Field(description='Source file path (e.g., "s3://bucket-name/file.csv")')
+    file_type: str = Field(default="csv", description='Source file type - "csv", "parquet", "json", "orc", "avro"')
+    bucket_name: str | None = Field(default=None, description="S3 bucket name (extracted from file_paths if not provided)")
+    bucket_type: str = Field(default="ibm_cos", description='Bucket type (e.g., "ibm_cos", "amazon_s3", "minio")')
+    write_mode: str = Field(default="append", description='Write mode - "append", "overwrite"')
+    engine_id: str | None = Field(default=None, description="Spark engine ID to use for ingestion")
+    field_delimiter: str = Field(default=",", description="CSV field delimiter")
+    line_delimiter: str = Field(default="\n", description="CSV line delimiter")
+    escape_character: str = Field(default="\\", description="CSV escape character")
+    header: bool = Field(default=True, description="Whether CSV has header row")
+    encoding: str = Field(default="UTF-8", description="File encoding")
+    driver_memory: str = Field(default="2G", description="Spark driver memory")
+    driver_cores: int = Field(default=1, description="Spark driver cores")
+    executor_memory: str = Field(default="2G", description="Spark executor memory")
+    executor_cores: int = Field(default=1, description="Spark executor cores")
+    num_executors: int = Field(default=1, description="Number of Spark executors")
+
+
+def build_ingestion_job_body(spec: IngestionJobSpec) -> dict[str, Any]:
+    """Build the v3 API request body for an ingestion job.
+
+    Args:
+        spec: Job specification
+
+    Returns:
+        Request body for POST /v3/lhingestion/api/v1/ingestion/jobs
+    """
+    # Extract bucket_name from file_paths if not provided
+    bucket_name = spec.bucket_name
+    if bucket_name is None and spec.file_paths.startswith("s3://"):
+        bucket_name = spec.file_paths[5:].partition("/")[0]
+
+    # Build v3 API request body with nested structure
+    body: dict[str, Any] = {
+        "job_id": spec.job_id,
+        "target": {
+            "catalog": spec.catalog,
+            "schema": spec.schema_,
+            "table": spec.table,
+            "write_mode": spec.write_mode,
+        },
+        "source": {
+            "file_paths": spec.file_paths,
+            "file_type": spec.file_type,
+            "bucket_details": {
+                "bucket_name": bucket_name,
+                "bucket_type": spec.bucket_type,
+            },
+        },
+        "execute_config": {
+            "driver_memory": spec.driver_memory,
+            "driver_cores": spec.driver_cores,
+            "executor_memory": spec.executor_memory,
+            "executor_cores": spec.executor_cores,
+            "num_executors": spec.num_executors,
+        },
+    }
+
+    # Add file format properties for CSV files
+    if spec.file_type == "csv":
+        body["source"]["file_format_properties"] = {
+            "field_delimiter": spec.field_delimiter,
+            "line_delimiter": spec.line_delimiter,
+            "escape_character": spec.escape_character,
+            "header": spec.header,
+            "encoding": spec.encoding,
+        }
+
+    # Add engine_id if provided
+    if spec.engine_id is not None:
+        body["engine_id"] = spec.engine_id
+
+    return body
+
+
 @mcp.tool()
 async def create_ingestion_job(
     ctx: Context,
@@ -71,51 +155,31 @@ async def create_ingestion_job(
     """
     watsonx_client = ctx.fastmcp.watsonx_client
 
-    # Extract bucket_name from file_paths if not provided
-    if bucket_name is None and file_paths.startswith("s3://"):
-        bucket_name = file_paths.split("/")[2]
-
-    # Build v3 API request body with nested structure
-    body: dict[str, Any] = {
-        "job_id": job_id,
-        "target": {
-            "catalog": catalog,
-            "schema": schema,
-            "table": table,
-            "write_mode": write_mode,
-        },
-        "source": {
-            "file_paths": file_paths,
-            "file_type": file_type,
-            "bucket_details": {
-                "bucket_name": bucket_name,
-                "bucket_type": bucket_type,
-            },
-        },
-        "execute_config": {
-            "driver_memory": driver_memory,
-            "driver_cores": driver_cores,
-            "executor_memory": executor_memory,
-            "executor_cores": executor_cores,
-            "num_executors": num_executors,
-        },
-    }
-
-    # Add file format properties for CSV files
-    if file_type == "csv":
-        body["source"]["file_format_properties"] = {
-            "field_delimiter": field_delimiter,
-            "line_delimiter": line_delimiter,
-            "escape_character": escape_character,
-            "header": header,
-            "encoding": encoding,
-        }
-
-    # Add engine_id if provided
-    if engine_id is not None:
-        body["engine_id"] = engine_id
+    spec = IngestionJobSpec(
+        job_id=job_id,
+        catalog=catalog,
+        schema=schema,
+        table=table,
+        file_paths=file_paths,
+        file_type=file_type,
+        bucket_name=bucket_name,
+        bucket_type=bucket_type,
+        write_mode=write_mode,
+        engine_id=engine_id,
+        field_delimiter=field_delimiter,
+        line_delimiter=line_delimiter,
+        escape_character=escape_character,
+        header=header,
+        encoding=encoding,
+        driver_memory=driver_memory,
+        driver_cores=driver_cores,
+        executor_memory=executor_memory,
+        executor_cores=executor_cores,
+        num_executors=num_executors,
+    )
+    body = build_ingestion_job_body(spec)
 
-    logger.info(
+    logger.debug(
         "creating_ingestion_job",
         job_id=job_id,
         file_paths=file_paths,
@@ -125,8 +189,7 @@ async def create_ingestion_job(
         table=table,
     )
 
-    path = "/v3/lhingestion/api/v1/ingestion/jobs"
-    response = await watsonx_client.post(path, body)
+    response = await watsonx_client.post(JOBS_PATH, body)
 
     # Check for API errors
     if response.get("error"):
@@ -0,0 +1,97 @@
+"""
+Create ingestion jobs tool.
+
+This tool creates several data ingestion jobs concurrently.
+
+This file has been modified with the assistance of IBM Bob AI tool
+"""
+
+import asyncio
+from typing import Any
+
+from fastmcp import Context
+
+from lakehouse_mcp.observability import get_logger
+from lakehouse_mcp.server import mcp
+from lakehouse_mcp.tools.ingestion.create_ingestion_job import IngestionJobSpec, build_ingestion_job_body
+from lakehouse_mcp.tools.ingestion.paths import JOBS_PATH
+
+logger = get_logger(__name__)
+
+# Maximum number of create requests in flight at once for a single batch
+_MAX_CONCURRENT_CREATES = 10
+
+
+@mcp.tool()
+async def create_ingestion_jobs(
+    ctx: Context,
+    specs: list[IngestionJobSpec],
+) -> dict[str, Any]:
+    """Create multiple data ingestion jobs concurrently.
+
+    Args:
+        specs: List of job specifications. Each spec takes the same fields as
+               create_ingestion_job (job_id, catalog, schema, table and file_paths
+               are required; all other fields are optional). A batch with an
+               invalid spec is rejected as a whole
+
+    Returns:
+        Dict with "created" (API responses for jobs that were created) and
+        "failed" (index, job_id, error_message and status_code for each job
+        the API did not create)
+    """
+    watsonx_client = ctx.fastmcp.watsonx_client
+
+    if not specs:
+        return {
+            "error": True,
+            "error_message": "specs must contain at least one job specification",
+            "status_code": 400,
+        }
+
+    bodies = [build_ingestion_job_body(spec) for spec in specs]
+
+    logger.debug("creating_ingestion_jobs", job_count=len(bodies))
+
+    semaphore = asyncio.Semaphore(_MAX_CONCURRENT_CREATES)
+
+    async def create_one(body: dict[str, Any]) -> dict[str, Any]:
+        async with semaphore:
+            return await watsonx_client.post(JOBS_PATH, body)
+
+    responses = await asyncio.gather(
+        *(create_one(body) for body in bodies),
+        return_exceptions=True,
+    )
+
+    created: list[dict[str, Any]] = []
+    failed: list[dict[str, Any]] = []
+    for index, (body, response) in enumerate(zip(bodies, responses, strict=True)):
+        if isinstance(response, BaseException):
+            failed.append(
+                {
+                    "index": index,
+                    "job_id": body["job_id"],
+                    "error_message": str(response) or type(response).__name__,
+                    "status_code": 0,
+                }
+            )
+        elif response.get("error"):
+            failed.append(
+                {
+                    "index": index,
+                    "job_id": body["job_id"],
+                    "error_message": response.get("error_message", "Unknown error"),
+                    "status_code": response.get("status_code", 0),
+                }
+            )
+        else:
+            created.append(response)
+
+    logger.info(
+        "ingestion_jobs_created",
+        created_count=len(created),
+        failed_count=len(failed),
+    )
+
+    return {"created": created, "failed": failed}
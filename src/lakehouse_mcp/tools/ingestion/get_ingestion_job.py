@@ -6,38 +6,53 @@ This tool gets detailed status of a data ingestion job.
 This file has been modified with the assistance of IBM Bob AI tool
 """
 
+import asyncio
 from typing import Any
 
 from fastmcp import Context
 
 from lakehouse_mcp.observability import get_logger
 from lakehouse_mcp.server import mcp
+from lakehouse_mcp.tools.ingestion.paths import JOB_PATH_FMT
 
 logger = get_logger(__name__)
 
+# In-flight lookups keyed by (job_id, fresh); concurrent polls for the same job share one
+# API call, but a fresh lookup never joins a cached one
+_inflight: dict[tuple[str, bool], asyncio.Future[dict[str, Any]]] = {}
+
 
 @mcp.tool()
 async def get_ingestion_job(
     ctx: Context,
     job_id: str,
+    fresh: bool = False,
 ) -> dict[str, Any]:
     """Get detailed status of a data ingestion job.
 
     Args:
         job_id: Job identifier
+        fresh: Bypass the short-lived read cache and always query the API (default: false)
 
     Returns:
         Dict with detailed job status, configuration, and execution details
     """
     watsonx_client = ctx.fastmcp.watsonx_client
 
-    logger.info(
+    logger.debug(
         "getting_ingestion_job",
         job_id=job_id,
     )
 
-    path = f"/v3/lhingestion/api/v1/ingestion/jobs/{job_id}"
-    response = await watsonx_client.get(path)
+    key = (job_id, fresh)
+    request = _inflight.get(key)
+    if request is None:
+        request = asyncio.ensure_future(watsonx_client.get(JOB_PATH_FMT.format(job_id), cache=not fresh))
+        _inflight[key] = request
+        request.add_done_callback(lambda _: _inflight.pop(key, None))
+
+    # Shield so a cancelled caller does not cancel the lookup other callers are awaiting
+    response = await asyncio.shield(request)
 
     # Check for API errors
     if response.get("error"):
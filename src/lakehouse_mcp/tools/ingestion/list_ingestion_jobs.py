@@ -12,6 +12,7 @@ from fastmcp import Context
 
 from lakehouse_mcp.observability import get_logger
 from lakehouse_mcp.server import mcp
+from lakehouse_mcp.tools.ingestion.paths import JOBS_PATH
 
 logger = get_logger(__name__)
 
@@ -33,25 +34,16 @@ async def list_ingestion_jobs(
     """
     watsonx_client = ctx.fastmcp.watsonx_client
 
-    # Build query parameters into path
-    path = "/v3/lhingestion/api/v1/ingestion/jobs"
-    query_params = []
-    
-    if start is not None:
-        query_params.append(f"start={start}")
-    if limit is not None:
-        query_params.append(f"limit={limit}")
-    
-    if query_params:
-        path = f"{path}?{'&'.join(query_params)}"
+    # Only send the pagination parameters that were provided
+    params = {k: v for k, v in (("start", start), ("limit", limit)) if v is not None}
 
-    logger.info(
+    logger.debug(
         "listing_ingestion_jobs",
         start=start,
         limit=limit,
     )
 
-    response = await watsonx_client.get(path)
+    response = await watsonx_client.get(JOBS_PATH, params=params)
 
     # Check for API errors
     if response.get("error"):
@@ -0,0 +1,10 @@
+"""
+Ingestion API paths.
+
+This module defines the watsonx.data ingestion API paths shared by the ingestion tools.
+
+This file has been modified with the assistance of IBM Bob AI tool
+"""
+
+JOBS_PATH = "/v3/lhingestion/api/v1/ingestion/jobs"
+JOB_PATH_FMT = JOBS_PATH + "/{}"
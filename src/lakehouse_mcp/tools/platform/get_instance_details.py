@@ -33,7 +33,7 @@ async def get_instance_details(ctx: Context) -> dict[str, Any]:
     """
     watsonx_client = ctx.fastmcp.watsonx_client
 
-    logger.info("getting_instance_details")
+    logger.debug("getting_instance_details")
 
     # Make API call to get instance details
     response = await watsonx_client.get("/v3/instance")
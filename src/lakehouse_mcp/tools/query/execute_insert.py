@@ -69,7 +69,7 @@ async def execute_insert(
             "status_code": 400,
         }
 
-    logger.info(
+    logger.debug(
         "executing_insert_query",
         catalog_name=catalog_name,
         schema_name=schema_name,
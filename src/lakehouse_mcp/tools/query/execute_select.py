@@ -71,7 +71,7 @@ async def execute_select(
         applied_limit = limit if limit is not None else 500
         final_sql = f"{sql.rstrip(';')} LIMIT {applied_limit}"
 
-    logger.info(
+    logger.debug(
         "executing_select_query",
         catalog_name=catalog_name,
         schema_name=schema_name,
@@ -72,7 +72,7 @@ async def execute_update(
             "status_code": 400,
         }
     
-    logger.info(
+    logger.debug(
         "executing_update_query",
         catalog_name=catalog_name,
         schema_name=schema_name,
@@ -46,7 +46,7 @@ async def explain_analyze_query(
             "status_code": 400,
         }
 
-    logger.info(
+    logger.debug(
         "explaining_analyzing_query",
         engine_id=engine_id,
         engine_type=engine_type,
@@ -48,7 +48,7 @@ async def explain_query(
             "status_code": 400,
         }
 
-    logger.info(
+    logger.debug(
         "explaining_query",
         engine_id=engine_id,
         engine_type=engine_type,
@@ -39,7 +39,7 @@ async def get_spark_application_status(
     """
     watsonx_client = ctx.fastmcp.watsonx_client
 
-    logger.info(
+    logger.debug(
         "getting_spark_application_status",
         engine_id=engine_id,
         application_id=application_id,
@@ -56,7 +56,7 @@ async def list_spark_applications(
     if query_params:
         path = f"{path}?{'&'.join(query_params)}"
 
-    logger.info(
+    logger.debug(
         "listing_spark_applications",
         engine_id=engine_id,
         state_filter=state,
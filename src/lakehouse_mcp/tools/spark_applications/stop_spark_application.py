@@ -35,7 +35,7 @@ async def stop_spark_application(
     """
     watsonx_client = ctx.fastmcp.watsonx_client
 
-    logger.info(
+    logger.debug(
         "stopping_spark_application",
         engine_id=engine_id,
         application_id=application_id,
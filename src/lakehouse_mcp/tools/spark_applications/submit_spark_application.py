@@ -120,7 +120,7 @@ async def submit_spark_application(
     if volumes is not None:
         body["volumes"] = volumes
 
-    logger.info(
+    logger.debug(
         "submitting_spark_application",
         engine_id=engine_id,
         application=application,
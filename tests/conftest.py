@@ -4,14 +4,19 @@ Shared test fixtures for ibm-watsonxdata-mcp-server tests.
 This file has been modified with the assistance of IBM Bob AI tool
 """
 
+import time
+from collections.abc import AsyncIterator, Iterator
 from typing import Any
 from unittest.mock import Mock
 
+import httpx
 import pytest
+import pytest_asyncio
 import respx
 from fastmcp import Context
 from ibm_cloud_sdk_core.authenticators import IAMAuthenticator
 
+from lakehouse_mcp.client import watsonx as watsonx_module
 from lakehouse_mcp.client.watsonx import WatsonXClient
 from lakehouse_mcp.config import WatsonXConfig
 
@@ -47,6 +52,12 @@ def watsonx_config(mock_env_vars: dict[str, str]) -> WatsonXConfig:
     return WatsonXConfig()
 
 
+@pytest.fixture(autouse=True)
+def no_retry_backoff(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Retry failed GET requests immediately so retry paths do not slow tests down."""
+    monkeypatch.setattr(watsonx_module, "RETRY_BACKOFF_BASE_SECONDS", 0.0)
+
+
 @pytest.fixture
 def mock_iam_authenticator() -> Mock:
     """Create mock IAM authenticator.
@@ -57,24 +68,51 @@ def mock_iam_authenticator() -> Mock:
     authenticator = Mock(spec=IAMAuthenticator)
     token_manager = Mock()
     token_manager.get_token.return_value = "mock_access_token_123"
+    token_manager.expire_time = int(time.time()) + 3600
+    token_manager.refresh_time = token_manager.expire_time - 720
     authenticator.token_manager = token_manager
     return authenticator
 
 
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def http_client() -> AsyncIterator[httpx.AsyncClient]:
+    """Create one httpx client shared by every test's WatsonXClient.
+
+    respx intercepts its transport, so no connections are ever opened.
+
+    The client is created on the session loop but used from tests on function-
+    and module-scoped loops. That only works because respx patches
+    AsyncConnectionPool.handle_async_request, so no connection or other
+    loop-bound state is ever created; a test that sends real traffic through
+    this client must use a client created on its own loop instead.
+
+    Yields:
+        httpx.AsyncClient instance
+    """
+    async with httpx.AsyncClient() as client:
+        yield client
+
+
 @pytest.fixture
-async def watsonx_client(watsonx_config: WatsonXConfig, mock_iam_authenticator: Mock) -> WatsonXClient:
+async def watsonx_client(
+    watsonx_config: WatsonXConfig,
+    mock_iam_authenticator: Mock,
+    http_client: httpx.AsyncClient,
+) -> AsyncIterator[WatsonXClient]:
     """Create WatsonX client for testing with mocked authenticator.
 
     Args:
         watsonx_config: WatsonX configuration
         mock_iam_authenticator: Mocked IAM authenticator
+        http_client: Shared httpx client
 
-    Returns:
+    Yields:
         WatsonXClient instance with mocked auth
     """
-    client = WatsonXClient(watsonx_config)
+    client = WatsonXClient(watsonx_config, http_client=http_client)
     client.authenticator = mock_iam_authenticator
-    return client
+    yield client
+    await client.close()
 
 
 @pytest.fixture
@@ -95,15 +133,32 @@ def mock_context(watsonx_client: WatsonXClient) -> Context:
     return context
 
 
+@pytest.fixture(scope="session")
+def _respx_router() -> Iterator[respx.MockRouter]:
+    """Start a single respx router that patches httpx for the whole session.
+
+    Yields:
+        respx MockRouter instance
+    """
+    router = respx.mock(assert_all_called=False)
+    router.start()
+    yield router
+    router.stop()
+
+
 @pytest.fixture
-def respx_mock() -> respx.MockRouter:
-    """Create respx mock for HTTP responses.
+def respx_mock(_respx_router: respx.MockRouter) -> Iterator[respx.MockRouter]:
+    """Provide the session respx router, restored to its prior state after the test.
+
+    Routes registered by longer-lived fixtures survive; routes, mocked responses
+    and call history added during the test are rolled back.
 
     Yields:
         respx MockRouter instance
     """
-    with respx.mock(assert_all_called=False) as respx_mock:
-        yield respx_mock
+    _respx_router.snapshot()
+    yield _respx_router
+    _respx_router.rollback()
 
 
 # Sample API response fixtures
@@ -4,10 +4,17 @@ Tests for watsonx.data client.
 This file has been modified with the assistance of IBM Bob AI tool
 """
 
+import asyncio
+import threading
+import time
+
 import httpx
+import orjson
 import pytest
+import structlog.testing
 
-from lakehouse_mcp.client.watsonx import WatsonXClient
+from lakehouse_mcp.client import watsonx as watsonx_module
+from lakehouse_mcp.client.watsonx import WatsonXClient, close_client, get_client
 
 
 class TestWatsonXClient:
@@ -36,12 +43,95 @@ class TestWatsonXClient:
         assert client.client.is_closed
 
     @pytest.mark.asyncio
-    async def test_get_auth_header(self, watsonx_client):
-        """Test getting authorization header."""
-        header = await watsonx_client._get_auth_header()
+    async def test_ensure_auth(self, watsonx_client):
+        """Test that the authorization header is installed on the HTTP client."""
+        await watsonx_client._ensure_auth()
+
+        assert "Authorization" in watsonx_client.client.headers
+        assert watsonx_client.client.headers["Authorization"] == "Bearer mock_access_token_123"
+
+    @pytest.mark.asyncio
+    async def test_ensure_auth_fetches_off_event_loop(self, watsonx_client, mock_iam_authenticator):
+        """Test that the blocking token fetch runs outside the event loop thread."""
+        fetch_threads = []
+
+        def get_token():
+            fetch_threads.append(threading.get_ident())
+            return "mock_access_token_123"
+
+        mock_iam_authenticator.token_manager.get_token.side_effect = get_token
+
+        await watsonx_client._ensure_auth()
+
+        assert fetch_threads
+        assert fetch_threads[0] != threading.get_ident()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_ensure_auth_fetches_token_once(self, watsonx_client, mock_iam_authenticator):
+        """Test that concurrent cold-start requests share a single token fetch."""
+        await asyncio.gather(*(watsonx_client._ensure_auth() for _ in range(5)))
+
+        assert watsonx_client.client.headers["Authorization"] == "Bearer mock_access_token_123"
+        assert mock_iam_authenticator.token_manager.get_token.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_auth_cached_until_refresh_time(self, watsonx_client, mock_iam_authenticator):
+        """Test that the token manager is only consulted once the cached token is due for refresh."""
+        await watsonx_client._ensure_auth()
+        await watsonx_client._ensure_auth()
+
+        assert mock_iam_authenticator.token_manager.get_token.call_count == 1
+
+        # Token due for refresh: the next call goes back to the token manager
+        mock_iam_authenticator.token_manager.refresh_time = int(time.time()) - 1
+        mock_iam_authenticator.token_manager.get_token.return_value = "refreshed_token_456"
+        watsonx_client._auth_expiry = 0.0
+
+        await watsonx_client._ensure_auth()
+
+        assert watsonx_client.client.headers["Authorization"] == "Bearer refreshed_token_456"
+        assert mock_iam_authenticator.token_manager.get_token.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_background_token_refresh(self, watsonx_client, mock_iam_authenticator, monkeypatch):
+        """Test that the background task renews the token once it is due."""
+        token_manager = mock_iam_authenticator.token_manager
+        token_manager.refresh_time = time.time() + 3600
 
-        assert "Authorization" in header
-        assert header["Authorization"] == "Bearer mock_access_token_123"
+        # Authenticate without starting the task, then drive the refresher directly:
+        # the first sleep returns at once (token due), the second stops the loop
+        await watsonx_client._refresh_auth()
+
+        class StopRefresherError(Exception):
+            pass
+
+        delays = []
+
+        async def fake_sleep(delay):
+            delays.append(delay)
+            if len(delays) == 2:
+                raise StopRefresherError
+
+        token_manager.get_token.return_value = "refreshed_token_456"
+        monkeypatch.setattr(watsonx_module.asyncio, "sleep", fake_sleep)
+
+        with pytest.raises(StopRefresherError):
+            await watsonx_client._token_refresher()
+
+        assert delays[0] == pytest.approx(3600, abs=60)
+        assert token_manager.get_token.call_count == 2
+        assert watsonx_client.client.headers["Authorization"] == "Bearer refreshed_token_456"
+
+    @pytest.mark.asyncio
+    async def test_close_cancels_token_refresh(self, watsonx_client):
+        """Test that closing the client stops the background refresh task."""
+        await watsonx_client._ensure_auth()
+        refresh_task = watsonx_client._refresh_task
+
+        await watsonx_client.close()
+
+        assert refresh_task.cancelled()
+        assert watsonx_client._refresh_task is None
 
     @pytest.mark.asyncio
     async def test_get_request_relative_path(self, watsonx_client, respx_mock):
@@ -81,6 +171,30 @@ class TestWatsonXClient:
         assert "Authorization" in request.headers
         assert request.headers["Authorization"] == "Bearer mock_access_token_123"
 
+    @pytest.mark.asyncio
+    async def test_get_request_with_params(self, watsonx_client, respx_mock):
+        """Test GET request query parameters are encoded by httpx."""
+        route = respx_mock.get("https://test.watsonx.com/api/v2/test").mock(return_value=httpx.Response(200, json={}))
+
+        await watsonx_client.get("/v2/test", params={"start": 0, "name": "a b&c"})
+
+        assert route.calls[0].request.url.params == httpx.QueryParams({"start": "0", "name": "a b&c"})
+
+    @pytest.mark.asyncio
+    async def test_request_logs_single_info_event(self, watsonx_client, respx_mock):
+        """Test that a successful request emits one info event with its duration."""
+        respx_mock.get("https://test.watsonx.com/api/v2/test").mock(return_value=httpx.Response(200, json={"ok": True}))
+
+        with structlog.testing.capture_logs() as logs:
+            await watsonx_client.get("/v2/test", params={"start": 0, "limit": 10})
+
+        info_events = [entry for entry in logs if entry["log_level"] == "info"]
+        assert len(info_events) == 1
+        assert info_events[0]["event"] == "watsonx_request"
+        assert info_events[0]["url"] == "https://test.watsonx.com/api/v2/test?start=0&limit=10"
+        assert info_events[0]["status_code"] == 200
+        assert info_events[0]["duration_ms"] >= 0
+
     @pytest.mark.asyncio
     async def test_get_request_404_error(self, watsonx_client, respx_mock):
         """Test GET request with 404 error."""
@@ -126,6 +240,28 @@ class TestWatsonXClient:
         assert result["error_message"] == "HTTP 502: Bad Gateway"
         assert result["status_code"] == 502
 
+    @pytest.mark.asyncio
+    async def test_get_request_non_object_json_error(self, watsonx_client, respx_mock):
+        """Test GET request error when the JSON error body is not an object."""
+        respx_mock.get("https://test.watsonx.com/api/v2/list-error").mock(return_value=httpx.Response(500, json=["unexpected"]))
+
+        result = await watsonx_client.get("/v2/list-error")
+
+        assert result["error"] is True
+        assert result["error_message"] == "HTTP 500: Internal Server Error"
+        assert result["status_code"] == 500
+
+    @pytest.mark.asyncio
+    async def test_get_request_empty_error_body(self, watsonx_client, respx_mock):
+        """Test GET request error with an empty response body."""
+        respx_mock.get("https://test.watsonx.com/api/v2/empty-error").mock(return_value=httpx.Response(503))
+
+        result = await watsonx_client.get("/v2/empty-error")
+
+        assert result["error"] is True
+        assert result["error_message"] == "HTTP 503: Service Unavailable"
+        assert result["status_code"] == 503
+
     @pytest.mark.asyncio
     async def test_post_request_relative_path(self, watsonx_client, respx_mock):
         """Test POST request with relative path."""
@@ -167,6 +303,10 @@ class TestWatsonXClient:
         assert request.method == "POST"
         # httpx sends json body, verify it's there
         assert b"SELECT 1" in request.content
+        assert orjson.loads(request.content) == request_body
+        # The orjson-encoded bytes go on the wire unchanged, with a matching Content-Length
+        assert request.content == orjson.dumps(request_body)
+        assert request.headers["Content-Length"] == str(len(request.content))
 
     @pytest.mark.asyncio
     async def test_post_request_201_response(self, watsonx_client, respx_mock):
@@ -236,14 +376,224 @@ class TestWatsonXClient:
         assert "Authorization" in request.headers
         assert request.headers["Authorization"] == "Bearer mock_access_token_123"
 
+    # Read cache tests
+
+    @pytest.mark.asyncio
+    async def test_get_request_cached(self, watsonx_client, respx_mock):
+        """Test that cached GET requests are served from the read cache."""
+        route = respx_mock.get("https://test.watsonx.com/api/v3/catalogs").mock(
+            return_value=httpx.Response(200, json={"catalogs": ["iceberg_data"]})
+        )
+
+        first = await watsonx_client.get("/v3/catalogs", cache=True)
+        second = await watsonx_client.get("/v3/catalogs", cache=True)
+
+        assert first == second == {"catalogs": ["iceberg_data"]}
+        assert first is not second
+        assert route.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_get_request_not_cached_by_default(self, watsonx_client, respx_mock):
+        """Test that GET requests bypass the read cache unless asked to use it."""
+        route = respx_mock.get("https://test.watsonx.com/api/v3/catalogs").mock(
+            return_value=httpx.Response(200, json={"catalogs": []})
+        )
+
+        await watsonx_client.get("/v3/catalogs", cache=True)
+        await watsonx_client.get("/v3/catalogs")
+
+        assert route.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_get_request_cache_expires(self, watsonx_client, respx_mock):
+        """Test that cached entries expire after the configured TTL."""
+        route = respx_mock.get("https://test.watsonx.com/api/v3/catalogs").mock(
+            return_value=httpx.Response(200, json={"catalogs": []})
+        )
+
+        await watsonx_client.get("/v3/catalogs", cache=True)
+        stored_at, content = watsonx_client._read_cache["https://test.watsonx.com/api/v3/catalogs"]
+        watsonx_client._read_cache["https://test.watsonx.com/api/v3/catalogs"] = (
+            stored_at - watsonx_client.config.read_cache_ttl_seconds,
+            content,
+        )
+        await watsonx_client.get("/v3/catalogs", cache=True)
+
+        assert route.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_write_clears_read_cache(self, watsonx_client, respx_mock):
+        """Test that a successful write invalidates cached reads."""
+        route = respx_mock.get("https://test.watsonx.com/api/v3/catalogs/iceberg_data/schemas").mock(
+            return_value=httpx.Response(200, json={"schemas": []})
+        )
+        respx_mock.post("https://test.watsonx.com/api/v3/catalogs/iceberg_data/schemas").mock(
+            return_value=httpx.Response(201, json={"name": "sales"})
+        )
+
+        await watsonx_client.get("/v3/catalogs/iceberg_data/schemas", cache=True)
+        await watsonx_client.post("/v3/catalogs/iceberg_data/schemas", {"name": "sales"})
+        await watsonx_client.get("/v3/catalogs/iceberg_data/schemas", cache=True)
+
+        assert route.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_error_responses_not_cached(self, watsonx_client, respx_mock):
+        """Test that error responses are never cached."""
+        route = respx_mock.get("https://test.watsonx.com/api/v3/catalogs").mock(
+            return_value=httpx.Response(500, json={"message": "Internal server error"})
+        )
+
+        await watsonx_client.get("/v3/catalogs", cache=True)
+        await watsonx_client.get("/v3/catalogs", cache=True)
+
+        assert route.call_count == 2
+
+    # Retry and circuit breaker tests
+
+    @pytest.mark.asyncio
+    async def test_get_request_retried_on_503(self, watsonx_client, respx_mock):
+        """Test that GET requests are retried on gateway errors."""
+        route = respx_mock.get("https://test.watsonx.com/api/v2/test").mock(
+            side_effect=[httpx.Response(503), httpx.Response(200, json={"ok": True})]
+        )
+
+        result = await watsonx_client.get("/v2/test")
+
+        assert result == {"ok": True}
+        assert route.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_get_request_retried_on_connect_error(self, watsonx_client, respx_mock):
+        """Test that GET requests are retried on connection errors."""
+        route = respx_mock.get("https://test.watsonx.com/api/v2/test").mock(
+            side_effect=[httpx.ConnectError("Connection refused"), httpx.Response(200, json={"ok": True})]
+        )
+
+        result = await watsonx_client.get("/v2/test")
+
+        assert result == {"ok": True}
+        assert route.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_get_request_retries_exhausted(self, watsonx_client, respx_mock):
+        """Test that the last gateway error is returned once retries are exhausted."""
+        route = respx_mock.get("https://test.watsonx.com/api/v2/test").mock(return_value=httpx.Response(504))
+
+        result = await watsonx_client.get("/v2/test")
+
+        assert result["error"] is True
+        assert result["status_code"] == 504
+        assert route.call_count == watsonx_client.config.retry_max_attempts
+
+    @pytest.mark.asyncio
+    async def test_post_request_not_retried(self, watsonx_client, respx_mock):
+        """Test that non-idempotent requests are never retried."""
+        route = respx_mock.post("https://test.watsonx.com/api/v2/test").mock(return_value=httpx.Response(503))
+
+        result = await watsonx_client.post("/v2/test", {"name": "test"})
+
+        assert result["status_code"] == 503
+        assert route.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_circuit_counts_one_failure_per_request(self, watsonx_client, respx_mock):
+        """Test that a request that exhausts its retries counts as a single failure."""
+        route = respx_mock.get("https://test.watsonx.com/api/v2/test").mock(return_value=httpx.Response(503))
+
+        await watsonx_client.get("/v2/test")
+
+        assert route.call_count == watsonx_client.config.retry_max_attempts
+        assert watsonx_client._consecutive_failures == 1
+        assert watsonx_client._circuit_opened_at is None
+
+    @pytest.mark.asyncio
+    async def test_circuit_opens_after_repeated_failures(self, watsonx_client, respx_mock):
+        """Test that requests fail fast once the failure threshold is reached."""
+        route = respx_mock.get("https://test.watsonx.com/api/v2/test").mock(return_value=httpx.Response(503))
+
+        for _ in range(watsonx_client.config.circuit_failure_threshold):
+            result = await watsonx_client.get("/v2/test")
+            assert "unavailable" not in result["error_message"]
+        calls = route.call_count
+
+        result = await watsonx_client.get("/v2/test")
+
+        assert result["error"] is True
+        assert result["status_code"] == 503
+        assert "unavailable" in result["error_message"]
+        assert route.call_count == calls
+
     @pytest.mark.asyncio
-    async def test_close_client(self, watsonx_client):
+    async def test_circuit_closes_after_successful_probe(self, watsonx_client, respx_mock):
+        """Test that a successful request after the reset timeout closes the circuit."""
+        route = respx_mock.get("https://test.watsonx.com/api/v2/test").mock(return_value=httpx.Response(200, json={}))
+        watsonx_client._consecutive_failures = watsonx_client.config.circuit_failure_threshold
+        watsonx_client._circuit_opened_at = time.monotonic() - watsonx_client.config.circuit_reset_seconds
+
+        await watsonx_client.get("/v2/test")
+
+        assert route.call_count == 1
+        assert watsonx_client._circuit_opened_at is None
+        assert watsonx_client._consecutive_failures == 0
+
+    @pytest.mark.asyncio
+    async def test_circuit_allows_single_probe(self, watsonx_client, respx_mock):
+        """Test that only one request is let through while the circuit is half-open."""
+
+        async def slow_ok(request):
+            await asyncio.sleep(0.01)
+            return httpx.Response(200, json={"ok": True})
+
+        route = respx_mock.get("https://test.watsonx.com/api/v2/test").mock(side_effect=slow_ok)
+        watsonx_client._consecutive_failures = watsonx_client.config.circuit_failure_threshold
+        watsonx_client._circuit_opened_at = time.monotonic() - watsonx_client.config.circuit_reset_seconds
+
+        results = await asyncio.gather(*(watsonx_client.get("/v2/test") for _ in range(3)))
+
+        assert route.call_count == 1
+        assert results[0] == {"ok": True}
+        assert all(result["status_code"] == 503 for result in results[1:])
+        assert watsonx_client._circuit_opened_at is None
+
+    @pytest.mark.asyncio
+    async def test_circuit_reopens_after_failed_probe(self, watsonx_client, respx_mock):
+        """Test that a failed probe re-opens the circuit for another reset timeout."""
+        route = respx_mock.get("https://test.watsonx.com/api/v2/test").mock(return_value=httpx.Response(503))
+        watsonx_client._consecutive_failures = watsonx_client.config.circuit_failure_threshold
+        watsonx_client._circuit_opened_at = time.monotonic() - watsonx_client.config.circuit_reset_seconds
+
+        await watsonx_client.get("/v2/test")
+        calls = route.call_count
+        result = await watsonx_client.get("/v2/test")
+
+        assert "unavailable" in result["error_message"]
+        assert route.call_count == calls
+        assert watsonx_client._circuit_probe_in_flight is False
+
+    @pytest.mark.asyncio
+    async def test_close_client(self, watsonx_config, mock_iam_authenticator):
         """Test closing the client."""
-        assert not watsonx_client.client.is_closed
+        client = WatsonXClient(watsonx_config)
+        client.authenticator = mock_iam_authenticator
+        assert not client.client.is_closed
 
-        await watsonx_client.close()
+        await client.close()
 
-        assert watsonx_client.client.is_closed
+        assert client.client.is_closed
+
+    @pytest.mark.asyncio
+    async def test_close_keeps_injected_http_client_open(self, watsonx_config):
+        """Test that close() leaves an injected httpx client open for its owner."""
+        async with httpx.AsyncClient() as http_client:
+            client = WatsonXClient(watsonx_config, http_client=http_client)
+
+            assert client.client is http_client
+            assert http_client.headers["AuthInstanceId"] == watsonx_config.instance_id
+
+            await client.close()
+
+            assert not http_client.is_closed
 
     @pytest.mark.asyncio
     async def test_instance_id_header(self, watsonx_client, respx_mock):
@@ -323,6 +673,8 @@ class TestWatsonXClient:
         request = route.calls[0].request
         assert request.method == "PATCH"
         assert b"New Name" in request.content
+        assert request.content == orjson.dumps(request_body)
+        assert request.headers["Content-Length"] == str(len(request.content))
 
     @pytest.mark.asyncio
     async def test_patch_request_with_auth_headers(self, watsonx_client, respx_mock):
@@ -509,3 +861,30 @@ class TestWatsonXClient:
         assert result["error"] is True
         assert result["error_message"] == "HTTP 502: Bad Gateway"
         assert result["status_code"] == 502
+
+
+class TestSharedClient:
+    """Tests for the process-wide client accessors."""
+
+    @pytest.mark.asyncio
+    async def test_get_client_returns_shared_instance(self, watsonx_config, monkeypatch):
+        """Test that get_client creates one client and reuses it."""
+        monkeypatch.setattr(watsonx_module, "_client", None)
+
+        client = get_client(watsonx_config)
+
+        assert get_client(watsonx_config) is client
+        await close_client()
+
+    @pytest.mark.asyncio
+    async def test_close_client_resets_shared_instance(self, watsonx_config, monkeypatch):
+        """Test that close_client closes the shared client and a new one is created afterwards."""
+        monkeypatch.setattr(watsonx_module, "_client", None)
+        client = get_client(watsonx_config)
+
+        await close_client()
+
+        assert client.client.is_closed
+        new_client = get_client(watsonx_config)
+        assert new_client is not client
+        await close_client()
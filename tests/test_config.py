@@ -83,6 +83,48 @@ class TestWatsonXConfig:
         config = WatsonXConfig()
         assert config.tls_insecure_skip_verify is True
 
+    def test_connection_pool_defaults(self, mock_env_vars):
+        """Test default HTTP/2 and connection pool settings."""
+        config = WatsonXConfig()
+
+        assert config.http2_enabled is True
+        assert config.max_connections == 200
+        assert config.max_keepalive_connections == 50
+        assert config.keepalive_expiry_seconds == 30.0
+
+    def test_connection_pool_validation(self, mock_env_vars, monkeypatch):
+        """Test connection pool value validation."""
+        monkeypatch.setenv("WATSONX_DATA_MAX_CONNECTIONS", "0")
+        with pytest.raises(ValidationError):
+            WatsonXConfig()
+
+        monkeypatch.setenv("WATSONX_DATA_MAX_CONNECTIONS", "20")
+        monkeypatch.setenv("WATSONX_DATA_HTTP2_ENABLED", "false")
+        config = WatsonXConfig()
+        assert config.max_connections == 20
+        assert config.http2_enabled is False
+
+    def test_read_cache_settings(self, mock_env_vars, monkeypatch):
+        """Test read cache defaults and validation."""
+        config = WatsonXConfig()
+        assert config.read_cache_ttl_seconds == 3.0
+        assert config.read_cache_max_entries == 256
+
+        monkeypatch.setenv("WATSONX_DATA_READ_CACHE_TTL_SECONDS", "120")
+        with pytest.raises(ValidationError):
+            WatsonXConfig()
+
+        monkeypatch.setenv("WATSONX_DATA_READ_CACHE_TTL_SECONDS", "0")
+        assert WatsonXConfig().read_cache_ttl_seconds == 0
+
+    def test_retry_and_circuit_breaker_defaults(self, mock_env_vars):
+        """Test default retry and circuit breaker settings."""
+        config = WatsonXConfig()
+
+        assert config.retry_max_attempts == 3
+        assert config.circuit_failure_threshold == 5
+        assert config.circuit_reset_seconds == 30.0
+
     def test_case_insensitive_env_vars(self, monkeypatch):
         """Test that environment variables are case-insensitive."""
         monkeypatch.setenv("watsonx_data_base_url", "https://test.watsonx.com/api")
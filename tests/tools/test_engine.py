@@ -216,6 +216,12 @@ class TestListEngines:
     async def test_list_engines_timeout(self, mock_context, watsonx_client, respx_mock):
         """Test listing engines with timeout."""
         respx_mock.get("https://test.watsonx.com/api/v3/presto_engines").mock(side_effect=httpx.TimeoutException("Request timed out"))
+        respx_mock.get("https://test.watsonx.com/api/v3/prestissimo_engines").mock(
+            return_value=httpx.Response(200, json={"prestissimo_engines": []})
+        )
+        respx_mock.get("https://test.watsonx.com/api/v3/spark_engines").mock(
+            return_value=httpx.Response(200, json={"spark_engines": []})
+        )
 
         with pytest.raises(httpx.TimeoutException):
             await list_engines(mock_context)
@@ -4,216 +4,421 @@ Tests for data ingestion tools.
 This file has been modified with the assistance of IBM Bob AI tool
 """
 
+import asyncio
+import functools
+import inspect
+import re
+from collections.abc import AsyncIterator, Iterator
+from pathlib import Path
+from typing import Any
+from unittest.mock import Mock
+
 import httpx
+import orjson
 import pytest
+import pytest_asyncio
+import respx
+from pydantic import TypeAdapter, ValidationError
+from respx.models import RouteList
 
+from lakehouse_mcp.client.watsonx import WatsonXClient
+from lakehouse_mcp.config import WatsonXConfig
 from lakehouse_mcp.tools.ingestion.cancel_ingestion_job import cancel_ingestion_job
-from lakehouse_mcp.tools.ingestion.create_ingestion_job import create_ingestion_job
+from lakehouse_mcp.tools.ingestion.create_ingestion_job import IngestionJobSpec, build_ingestion_job_body, create_ingestion_job
+from lakehouse_mcp.tools.ingestion.create_ingestion_jobs import create_ingestion_jobs
 from lakehouse_mcp.tools.ingestion.get_ingestion_job import get_ingestion_job
 from lakehouse_mcp.tools.ingestion.list_ingestion_jobs import list_ingestion_jobs
 
+pytestmark = pytest.mark.asyncio(loop_scope="module")
+
+_BASE_URL = httpx.URL("https://test.watsonx.com")
+_JOBS_URL = _BASE_URL.join("/api/v3/lhingestion/api/v1/ingestion/jobs")
+# Matches a single job's URL for any job ID; shared by the get and cancel routes
+_JOB_URL_RE = re.compile(rf"^{re.escape(str(_JOBS_URL))}/[^/?]+$")
+
+# Mock API payloads keyed by case name, parsed once when the module is imported
+_PAYLOADS_PATH = Path(__file__).parent / "fixtures" / "ingestion_payloads.json"
+_PAYLOADS: dict[str, dict[str, Any]] = orjson.loads(_PAYLOADS_PATH.read_bytes())
+
+_DEFAULT_CSV_PROPERTIES = {
+    "field_delimiter": ",",
+    "line_delimiter": "\n",
+    "escape_character": "\\",
+    "header": True,
+    "encoding": "UTF-8",
+}
+
+
+def _json_response(status_code: int, payload: dict[str, Any]) -> httpx.Response:
+    """Build a JSON response; respx clones it per request, so instances can be shared."""
+    return httpx.Response(
+        status_code,
+        content=orjson.dumps(payload),
+        headers={"content-type": "application/json"},
+    )
+
+
+def _created_payload(job_id: str) -> dict[str, Any]:
+    return {"job_id": job_id, "status": "starting", "start_timestamp": "1770411298720316572"}
+
+
+@functools.cache
+def _created_response(job_id: str) -> httpx.Response:
+    """Build (once per job ID) the API response for a newly created job."""
+    return _json_response(200, _created_payload(job_id))
+
+
+_LIST_ALL_JOBS_RESPONSE = _json_response(200, _PAYLOADS["list_all"])
+_LIST_PAGE_RESPONSE = _json_response(200, _PAYLOADS["list_page"])
+_LIST_EMPTY_RESPONSE = _json_response(200, _PAYLOADS["list_empty"])
+_RUNNING_JOB = {"job_id": "job-123", "status": "running"}
+_RUNNING_JOB_RESPONSE = _json_response(200, _RUNNING_JOB)
+_CANCELLED_RESPONSE = _json_response(200, {"message": "Ingestion job cancelled successfully"})
+_JOB_NOT_FOUND_RESPONSE = _json_response(404, {"message": "Ingestion job not found"})
+_NO_CONTENT_RESPONSE = httpx.Response(204)
+
+
+@pytest_asyncio.fixture(loop_scope="module")
+async def watsonx_client(
+    watsonx_config: WatsonXConfig,
+    mock_iam_authenticator: Mock,
+    http_client: httpx.AsyncClient,
+) -> AsyncIterator[WatsonXClient]:
+    """Create the WatsonX client on the module event loop the tests run on.
+
+    Overrides the conftest fixture, whose function-scoped loop would leave the
+    client's token refresh task on a different loop than the test.
+
+    Yields:
+        WatsonXClient instance with mocked auth
+    """
+    client = WatsonXClient(watsonx_config, http_client=http_client)
+    client.authenticator = mock_iam_authenticator
+    yield client
+    await client.close()
+
+
+@pytest.fixture(scope="module")
+def _ingestion_routes(_respx_router: respx.MockRouter) -> Iterator[RouteList]:
+    """Register the ingestion job routes once for every test in this module.
+
+    Yields:
+        The router's route list, indexable by route name
+    """
+    names = ("create", "list", "get", "cancel")
+    _respx_router.post(_JOBS_URL, name="create")
+    _respx_router.get(_JOBS_URL, name="list")
+    _respx_router.get(url__regex=_JOB_URL_RE, name="get")
+    _respx_router.delete(url__regex=_JOB_URL_RE, name="cancel")
+    yield _respx_router.routes
+    for name in names:
+        _respx_router.routes.pop(name)
+
+
+@pytest.fixture
+def ingestion_routes(_ingestion_routes: RouteList, respx_mock: respx.MockRouter) -> RouteList:
+    """Provide the shared ingestion routes; responses and calls reset after each test.
+
+    Returns:
+        Route list with "create", "list", "get" and "cancel" routes
+    """
+    return _ingestion_routes
+
 
 class TestCreateIngestionJob:
     """Tests for create_ingestion_job tool."""
 
-    @pytest.mark.asyncio
-    async def test_create_basic_ingestion_job(
+    @pytest.mark.parametrize(
+        ("job_id", "extra_kwargs", "expected_source", "expected_execute_config"),
+        [
+            pytest.param(
+                "job-123",
+                {"table": "my_table", "file_paths": "s3://bucket/data/input.csv", "file_type": "csv"},
+                {
+                    "bucket_details": {"bucket_name": "bucket", "bucket_type": "ibm_cos"},
+                    "file_format_properties": _DEFAULT_CSV_PROPERTIES,
+                },
+                {"num_executors": 1},
+                id="basic",
+            ),
+            pytest.param(
+                "job-456",
+                {
+                    "table": "csv_table",
+                    "file_paths": "s3://bucket/data/input.csv",
+                    "file_type": "csv",
+                    "field_delimiter": ",",
+                    "header": True,
+                },
+                {"file_format_properties": _DEFAULT_CSV_PROPERTIES},
+                {},
+                id="csv_config",
+            ),
+            pytest.param(
+                "job-789",
+                {"table": "partitioned_table", "file_paths": "s3://bucket/data/parquet/*.parquet", "file_type": "parquet"},
+                {"file_type": "parquet"},
+                {},
+                id="parquet",
+            ),
+            pytest.param(
+                "job-abc",
+                {
+                    "table": "large_table",
+                    "file_paths": "s3://bucket/data/large-dataset.json",
+                    "file_type": "json",
+                    "engine_id": "spark473",
+                    "executor_memory": "4G",
+                    "executor_cores": 2,
+                },
+                {},
+                {
+                    "driver_memory": "2G",
+                    "driver_cores": 1,
+                    "executor_memory": "4G",
+                    "executor_cores": 2,
+                    "num_executors": 1,
+                },
+                id="spark_config",
+            ),
+            pytest.param(
+                "job-def",
+                {
+                    "table": "typed_table",
+                    "file_paths": "s3://bucket/data/input.csv",
+                    "file_type": "csv",
+                    "write_mode": "overwrite",
+                },
+                {},
+                {},
+                id="write_mode",
+            ),
+        ],
+    )
+    async def test_create_ingestion_job(
         self,
         mock_context,
         watsonx_client,
-        respx_mock,
+        ingestion_routes,
+        job_id,
+        extra_kwargs,
+        expected_source,
+        expected_execute_config,
     ):
-        """Test creating a basic ingestion job."""
-        mock_response = {
-            "job_id": "job-123",
-            "status": "starting",
-            "start_timestamp": "1770411298720316572",
-        }
-
-        respx_mock.post("https://test.watsonx.com/api/v3/lhingestion/api/v1/ingestion/jobs").mock(
-            return_value=httpx.Response(200, json=mock_response)
-        )
+        """Test creating ingestion jobs with different source and Spark configurations."""
+        route = ingestion_routes["create"].mock(return_value=_created_response(job_id))
 
         result = await create_ingestion_job(
             mock_context,
+            job_id=job_id,
+            catalog="iceberg_data",
+            schema="default",
+            **extra_kwargs,
+        )
+
+        request_body = orjson.loads(route.calls[0].request.content)
+        assert request_body["job_id"] == job_id
+        assert request_body["target"]["table"] == extra_kwargs["table"]
+        assert request_body["target"]["write_mode"] == extra_kwargs.get("write_mode", "append")
+        for key, value in expected_source.items():
+            assert request_body["source"][key] == value
+        for key, value in expected_execute_config.items():
+            assert request_body["execute_config"][key] == value
+        if extra_kwargs["file_type"] != "csv":
+            assert "file_format_properties" not in request_body["source"]
+        if "engine_id" in extra_kwargs:
+            assert request_body["engine_id"] == extra_kwargs["engine_id"]
+
+        assert result == _created_payload(job_id)
+
+    async def test_build_body_does_not_share_defaults(self):
+        """Test that mutating a built body leaves later bodies unchanged."""
+        spec = IngestionJobSpec(
             job_id="job-123",
             catalog="iceberg_data",
             schema="default",
             table="my_table",
             file_paths="s3://bucket/data/input.csv",
-            file_type="csv",
         )
 
-        assert result["job_id"] == "job-123"
-        assert result["status"] == "starting"
-        assert "start_timestamp" in result
+        body = build_ingestion_job_body(spec)
+        body["execute_config"]["num_executors"] = 8
+        body["source"]["file_format_properties"]["header"] = False
 
-    @pytest.mark.asyncio
-    async def test_create_ingestion_job_with_csv_config(
-        self,
-        mock_context,
-        watsonx_client,
-        respx_mock,
-    ):
-        """Test creating an ingestion job with CSV configuration."""
-        mock_response = {
-            "job_id": "job-456",
-            "status": "starting",
-            "start_timestamp": "1770411298720316572",
-        }
+        body = build_ingestion_job_body(spec)
+        assert body["execute_config"]["num_executors"] == 1
+        assert body["source"]["file_format_properties"] == _DEFAULT_CSV_PROPERTIES
 
-        respx_mock.post("https://test.watsonx.com/api/v3/lhingestion/api/v1/ingestion/jobs").mock(
-            return_value=httpx.Response(200, json=mock_response)
-        )
-
-        result = await create_ingestion_job(
-            mock_context,
-            job_id="job-456",
+    async def test_build_body_maps_custom_settings(self):
+        """Test that non-default Spark and CSV settings land under their own keys."""
+        spec = IngestionJobSpec(
+            job_id="job-123",
             catalog="iceberg_data",
             schema="default",
-            table="csv_table",
+            table="my_table",
             file_paths="s3://bucket/data/input.csv",
-            file_type="csv",
-            field_delimiter=",",
-            header=True,
-        )
+            field_delimiter="|",
+            line_delimiter="\r\n",
+            escape_character='"',
+            header=False,
+            encoding="latin-1",
+            driver_memory="4G",
+            driver_cores=2,
+            executor_memory="8G",
+            executor_cores=4,
+            num_executors=3,
+        )
+
+        body = build_ingestion_job_body(spec)
+        assert body["execute_config"] == {
+            "driver_memory": "4G",
+            "driver_cores": 2,
+            "executor_memory": "8G",
+            "executor_cores": 4,
+            "num_executors": 3,
+        }
+        assert body["source"]["file_format_properties"] == {
+            "field_delimiter": "|",
+            "line_delimiter": "\r\n",
+            "escape_character": '"',
+            "header": False,
+            "encoding": "latin-1",
+        }
+
+    async def test_tool_defaults_match_spec(self):
+        """Test that create_ingestion_job's parameter defaults match IngestionJobSpec."""
+        parameters = inspect.signature(create_ingestion_job).parameters
 
-        assert result["job_id"] == "job-456"
-        assert result["status"] == "starting"
+        for name, field in IngestionJobSpec.model_fields.items():
+            parameter = parameters[field.alias or name]
+            expected = inspect.Parameter.empty if field.is_required() else field.default
+            assert parameter.default == expected, name
 
-    @pytest.mark.asyncio
-    async def test_create_ingestion_job_with_parquet(
+
+class TestCreateIngestionJobs:
+    """Tests for create_ingestion_jobs tool."""
+
+    async def test_create_jobs_concurrently(
         self,
         mock_context,
         watsonx_client,
-        respx_mock,
+        ingestion_routes,
     ):
-        """Test creating an ingestion job with parquet files."""
-        mock_response = {
-            "job_id": "job-789",
-            "status": "starting",
-            "start_timestamp": "1770411298720316572",
-        }
+        """Test creating several ingestion jobs in one call."""
+
+        def respond(request):
+            job_id = orjson.loads(request.content)["job_id"]
+            return _json_response(200, {"job_id": job_id, "status": "starting"})
+
+        route = ingestion_routes["create"].mock(side_effect=respond)
+        specs = [
+            IngestionJobSpec(
+                job_id=f"job-{i}",
+                catalog="iceberg_data",
+                schema="default",
+                table=f"table_{i}",
+                file_paths=f"s3://bucket/data/input{i}.csv",
+            )
+            for i in range(15)
+        ]
+
+        result = await create_ingestion_jobs(mock_context, specs=specs)
+
+        assert route.call_count == 15
+        assert [job["job_id"] for job in result["created"]] == [f"job-{i}" for i in range(15)]
+        assert result["failed"] == []
+
+    async def test_create_jobs_partial_failure(
+        self,
+        mock_context,
+        watsonx_client,
+        ingestion_routes,
+    ):
+        """Test that API errors are reported per job."""
 
-        respx_mock.post("https://test.watsonx.com/api/v3/lhingestion/api/v1/ingestion/jobs").mock(
-            return_value=httpx.Response(200, json=mock_response)
-        )
+        def respond(request):
+            job_id = orjson.loads(request.content)["job_id"]
+            if job_id == "job-bad":
+                return _json_response(400, {"message": "Table not found"})
+            return _json_response(200, {"job_id": job_id, "status": "starting"})
 
-        result = await create_ingestion_job(
+        route = ingestion_routes["create"].mock(side_effect=respond)
+        base = {"catalog": "iceberg_data", "schema": "default", "table": "t", "file_paths": "s3://bucket/f.csv"}
+
+        result = await create_ingestion_jobs(
             mock_context,
-            job_id="job-789",
-            catalog="iceberg_data",
-            schema="default",
-            table="partitioned_table",
-            file_paths="s3://bucket/data/parquet/*.parquet",
-            file_type="parquet",
+            specs=[
+                IngestionJobSpec(job_id="job-ok", **base),
+                IngestionJobSpec(job_id="job-bad", **base),
+                IngestionJobSpec(job_id="job-ok-2", **base),
+            ],
         )
 
-        assert result["job_id"] == "job-789"
-        assert result["status"] == "starting"
+        assert route.call_count == 3
+        assert [job["job_id"] for job in result["created"]] == ["job-ok", "job-ok-2"]
+        assert [(f["index"], f["job_id"], f["status_code"]) for f in result["failed"]] == [(1, "job-bad", 400)]
+        assert "Table not found" in result["failed"][0]["error_message"]
 
-    @pytest.mark.asyncio
-    async def test_create_ingestion_job_with_spark_config(
+    async def test_create_jobs_cancelled_request(
         self,
         mock_context,
         watsonx_client,
-        respx_mock,
+        ingestion_routes,
     ):
-        """Test creating an ingestion job with Spark executor configuration."""
-        mock_response = {
-            "job_id": "job-abc",
-            "status": "starting",
-            "start_timestamp": "1770411298720316572",
-        }
+        """Test that a cancelled create request is reported as a failed job."""
 
-        respx_mock.post("https://test.watsonx.com/api/v3/lhingestion/api/v1/ingestion/jobs").mock(
-            return_value=httpx.Response(200, json=mock_response)
-        )
+        def cancel(request):
+            raise asyncio.CancelledError
 
-        result = await create_ingestion_job(
-            mock_context,
-            job_id="job-abc",
+        ingestion_routes["create"].mock(side_effect=cancel)
+        spec = IngestionJobSpec(
+            job_id="job-cancelled",
             catalog="iceberg_data",
             schema="default",
-            table="large_table",
-            file_paths="s3://bucket/data/large-dataset.json",
-            file_type="json",
-            engine_id="spark473",
-            executor_memory="4G",
-            executor_cores=2,
+            table="t",
+            file_paths="s3://bucket/f.csv",
         )
 
-        assert result["job_id"] == "job-abc"
-        assert result["status"] == "starting"
+        result = await create_ingestion_jobs(mock_context, specs=[spec])
 
-    @pytest.mark.asyncio
-    async def test_create_ingestion_job_with_write_mode(
+        assert result == {
+            "created": [],
+            "failed": [
+                {"index": 0, "job_id": "job-cancelled", "error_message": "CancelledError", "status_code": 0},
+            ],
+        }
+
+    async def test_create_jobs_rejects_invalid_batch(self):
+        """Test that one invalid spec fails validation of the whole batch."""
+        specs_adapter = TypeAdapter(inspect.signature(create_ingestion_jobs).parameters["specs"].annotation)
+        base = {"catalog": "iceberg_data", "schema": "default", "table": "t", "file_paths": "s3://bucket/f.csv"}
+
+        with pytest.raises(ValidationError, match="file_paths"):
+            specs_adapter.validate_python([{"job_id": "job-ok", **base}, {"job_id": "job-null-path", **base, "file_paths": None}])
+
+    async def test_create_jobs_empty_specs(
         self,
         mock_context,
         watsonx_client,
-        respx_mock,
     ):
-        """Test creating an ingestion job with overwrite mode."""
-        mock_response = {
-            "job_id": "job-def",
-            "status": "starting",
-            "start_timestamp": "1770411298720316572",
-        }
+        """Test that an empty batch is rejected."""
+        result = await create_ingestion_jobs(mock_context, specs=[])
 
-        respx_mock.post("https://test.watsonx.com/api/v3/lhingestion/api/v1/ingestion/jobs").mock(
-            return_value=httpx.Response(200, json=mock_response)
-        )
-
-        result = await create_ingestion_job(
-            mock_context,
-            job_id="job-def",
-            catalog="iceberg_data",
-            schema="default",
-            table="typed_table",
-            file_paths="s3://bucket/data/input.csv",
-            file_type="csv",
-            write_mode="overwrite",
-        )
-
-        assert result["job_id"] == "job-def"
-        assert result["status"] == "starting"
+        assert result["error"] is True
+        assert result["status_code"] == 400
 
 
 class TestListIngestionJobs:
     """Tests for list_ingestion_jobs tool."""
 
-    @pytest.mark.asyncio
     async def test_list_all_jobs(
         self,
         mock_context,
         watsonx_client,
-        respx_mock,
+        ingestion_routes,
     ):
         """Test listing all ingestion jobs."""
-        mock_response = {
-            "ingestion_jobs": [
-                {
-                    "job_id": "job-123",
-                    "status": "running",
-                    "source_data_files": "s3://bucket/data/input1.csv",
-                    "target_table": "iceberg_data.default.table1",
-                    "create_time": "2024-01-01T00:00:00Z",
-                },
-                {
-                    "job_id": "job-456",
-                    "status": "completed",
-                    "source_data_files": "s3://bucket/data/input2.parquet",
-                    "target_table": "iceberg_data.default.table2",
-                    "create_time": "2024-01-01T01:00:00Z",
-                    "end_time": "2024-01-01T02:00:00Z",
-                },
-            ],
-            "total_count": 2,
-        }
-
-        respx_mock.get("https://test.watsonx.com/api/v3/lhingestion/api/v1/ingestion/jobs").mock(
-            return_value=httpx.Response(200, json=mock_response)
-        )
+        ingestion_routes["list"].mock(return_value=_LIST_ALL_JOBS_RESPONSE)
 
         result = await list_ingestion_jobs(
             mock_context,
@@ -225,31 +430,14 @@ class TestListIngestionJobs:
         assert result["ingestion_jobs"][1]["job_id"] == "job-456"
         assert result["ingestion_jobs"][1]["status"] == "completed"
 
-    @pytest.mark.asyncio
     async def test_list_jobs_with_pagination(
         self,
         mock_context,
         watsonx_client,
-        respx_mock,
+        ingestion_routes,
     ):
         """Test listing ingestion jobs with pagination."""
-        mock_response = {
-            "ingestion_jobs": [
-                {
-                    "job_id": "job-123",
-                    "status": "running",
-                    "source_data_files": "s3://bucket/data/input.csv",
-                    "target_table": "iceberg_data.default.table",
-                    "create_time": "2024-01-01T00:00:00Z",
-                },
-            ],
-            "total_count": 50,
-            "page": 2,
-        }
-
-        respx_mock.get("https://test.watsonx.com/api/v3/lhingestion/api/v1/ingestion/jobs").mock(
-            return_value=httpx.Response(200, json=mock_response)
-        )
+        route = ingestion_routes["list"].mock(return_value=_LIST_PAGE_RESPONSE)
 
         result = await list_ingestion_jobs(
             mock_context,
@@ -257,26 +445,19 @@ class TestListIngestionJobs:
             limit=10,
         )
 
+        assert route.calls[0].request.url.params == httpx.QueryParams({"start": "10", "limit": "10"})
         assert len(result["ingestion_jobs"]) == 1
         assert result["total_count"] == 50
         assert result["page"] == 2
 
-    @pytest.mark.asyncio
     async def test_list_jobs_empty(
         self,
         mock_context,
         watsonx_client,
-        respx_mock,
+        ingestion_routes,
     ):
         """Test listing ingestion jobs when none exist."""
-        mock_response = {
-            "ingestion_jobs": [],
-            "total_count": 0,
-        }
-
-        respx_mock.get("https://test.watsonx.com/api/v3/lhingestion/api/v1/ingestion/jobs").mock(
-            return_value=httpx.Response(200, json=mock_response)
-        )
+        ingestion_routes["list"].mock(return_value=_LIST_EMPTY_RESPONSE)
 
         result = await list_ingestion_jobs(
             mock_context,
@@ -289,223 +470,125 @@ class TestListIngestionJobs:
 class TestGetIngestionJob:
     """Tests for get_ingestion_job tool."""
 
-    @pytest.mark.asyncio
-    async def test_get_running_job(
+    @pytest.mark.parametrize("status", ["running", "completed", "failed", "queued"])
+    async def test_get_job(
         self,
         mock_context,
         watsonx_client,
-        respx_mock,
+        ingestion_routes,
+        status,
     ):
-        """Test getting status of a running ingestion job."""
-        mock_response = {
-            "job_id": "job-123",
-            "status": "running",
-            "source_data_files": "s3://bucket/data/input.csv",
-            "target_table": "iceberg_data.default.my_table",
-            "username": "test_user",
-            "create_time": "2024-01-01T00:00:00Z",
-            "start_time": "2024-01-01T00:01:00Z",
-            "progress": 45.5,
-            "rows_processed": 1000000,
-        }
-
-        respx_mock.get("https://test.watsonx.com/api/v3/lhingestion/api/v1/ingestion/jobs/job-123").mock(
-            return_value=httpx.Response(200, json=mock_response)
-        )
+        """Test getting the status of ingestion jobs in each lifecycle state."""
+        mock_response = _PAYLOADS[f"get_{status}"]
+        job_id = mock_response["job_id"]
+        ingestion_routes["get"].mock(return_value=_json_response(200, mock_response))
 
         result = await get_ingestion_job(
             mock_context,
-            job_id="job-123",
+            job_id=job_id,
         )
 
-        assert result["job_id"] == "job-123"
-        assert result["status"] == "running"
-        assert result["progress"] == 45.5
-        assert result["rows_processed"] == 1000000
+        assert ingestion_routes["get"].calls.last.request.url.path.endswith(f"/jobs/{job_id}")
+        assert result == mock_response
 
-    @pytest.mark.asyncio
-    async def test_get_completed_job(
+    async def test_concurrent_gets_share_one_request(
         self,
         mock_context,
         watsonx_client,
-        respx_mock,
+        ingestion_routes,
     ):
-        """Test getting status of a completed ingestion job."""
-        mock_response = {
-            "job_id": "job-456",
-            "status": "completed",
-            "source_data_files": "s3://bucket/data/input.parquet",
-            "target_table": "iceberg_data.default.completed_table",
-            "username": "test_user",
-            "create_time": "2024-01-01T00:00:00Z",
-            "start_time": "2024-01-01T00:01:00Z",
-            "end_time": "2024-01-01T01:00:00Z",
-            "rows_processed": 5000000,
-            "bytes_processed": 1073741824,
-        }
+        """Test that concurrent lookups of the same job are coalesced into one API call."""
+        route = ingestion_routes["get"].mock(return_value=_RUNNING_JOB_RESPONSE)
 
-        respx_mock.get("https://test.watsonx.com/api/v3/lhingestion/api/v1/ingestion/jobs/job-456").mock(
-            return_value=httpx.Response(200, json=mock_response)
-        )
+        results = await asyncio.gather(*(get_ingestion_job(mock_context, job_id="job-123") for _ in range(3)))
 
-        result = await get_ingestion_job(
-            mock_context,
-            job_id="job-456",
-        )
+        assert route.call_count == 1
+        assert results == [_RUNNING_JOB] * 3
 
-        assert result["job_id"] == "job-456"
-        assert result["status"] == "completed"
-        assert "end_time" in result
-        assert result["rows_processed"] == 5000000
-
-    @pytest.mark.asyncio
-    async def test_get_failed_job(
+    async def test_get_job_fresh_bypasses_cache(
         self,
         mock_context,
         watsonx_client,
-        respx_mock,
+        ingestion_routes,
     ):
-        """Test getting status of a failed ingestion job."""
-        mock_response = {
-            "job_id": "job-789",
-            "status": "failed",
-            "source_data_files": "s3://bucket/data/bad-input.csv",
-            "target_table": "iceberg_data.default.failed_table",
-            "username": "test_user",
-            "create_time": "2024-01-01T00:00:00Z",
-            "start_time": "2024-01-01T00:01:00Z",
-            "end_time": "2024-01-01T00:05:00Z",
-            "error_message": "Schema mismatch: expected INT but found STRING in column 'id'",
-        }
+        """Test that repeated polls are cached unless fresh is requested."""
+        route = ingestion_routes["get"].mock(return_value=_RUNNING_JOB_RESPONSE)
 
-        respx_mock.get("https://test.watsonx.com/api/v3/lhingestion/api/v1/ingestion/jobs/job-789").mock(
-            return_value=httpx.Response(200, json=mock_response)
-        )
-
-        result = await get_ingestion_job(
-            mock_context,
-            job_id="job-789",
-        )
+        await get_ingestion_job(mock_context, job_id="job-123")
+        await get_ingestion_job(mock_context, job_id="job-123")
+        assert route.call_count == 1
 
-        assert result["job_id"] == "job-789"
-        assert result["status"] == "failed"
-        assert "error_message" in result
-        assert "Schema mismatch" in result["error_message"]
+        await get_ingestion_job(mock_context, job_id="job-123", fresh=True)
+        assert route.call_count == 2
 
-    @pytest.mark.asyncio
-    async def test_get_queued_job(
+    async def test_fresh_get_does_not_join_cached_lookup(
         self,
         mock_context,
         watsonx_client,
-        respx_mock,
+        ingestion_routes,
     ):
-        """Test getting status of a queued ingestion job."""
-        mock_response = {
-            "job_id": "job-abc",
-            "status": "queued",
-            "source_data_files": "s3://bucket/data/input.json",
-            "target_table": "iceberg_data.default.queued_table",
-            "username": "test_user",
-            "create_time": "2024-01-01T00:00:00Z",
-        }
-
-        respx_mock.get("https://test.watsonx.com/api/v3/lhingestion/api/v1/ingestion/jobs/job-abc").mock(
-            return_value=httpx.Response(200, json=mock_response)
-        )
+        """Test that a fresh lookup issues its own API call while a cached one is in flight."""
+        route = ingestion_routes["get"].mock(return_value=_RUNNING_JOB_RESPONSE)
 
-        result = await get_ingestion_job(
-            mock_context,
-            job_id="job-abc",
+        await asyncio.gather(
+            get_ingestion_job(mock_context, job_id="job-123"),
+            get_ingestion_job(mock_context, job_id="job-123", fresh=True),
         )
 
-        assert result["job_id"] == "job-abc"
-        assert result["status"] == "queued"
-        assert "start_time" not in result
+        assert route.call_count == 2
 
 
 class TestCancelIngestionJob:
     """Tests for cancel_ingestion_job tool."""
 
-    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("job_id", "mock_response", "expected"),
+        [
+            pytest.param(
+                "job-123",
+                _CANCELLED_RESPONSE,
+                {"message": "Ingestion job cancelled successfully"},
+                id="json_body",
+            ),
+            # 204 No Content response returns empty body, which becomes {"success": True}
+            pytest.param("job-running", _NO_CONTENT_RESPONSE, {"success": True}, id="running"),
+            pytest.param("job-completed", _NO_CONTENT_RESPONSE, {"success": True}, id="completed"),
+        ],
+    )
     async def test_cancel_job_success(
         self,
         mock_context,
         watsonx_client,
-        respx_mock,
-    ):
-        """Test successfully cancelling an ingestion job."""
-        mock_response = {
-            "message": "Ingestion job cancelled successfully",
-        }
-
-        respx_mock.delete("https://test.watsonx.com/api/v3/lhingestion/api/v1/ingestion/jobs/job-123").mock(
-            return_value=httpx.Response(200, json=mock_response)
-        )
-
-        result = await cancel_ingestion_job(
-            mock_context,
-            job_id="job-123",
-        )
-
-        assert "message" in result
-
-    @pytest.mark.asyncio
-    async def test_cancel_running_job(
-        self,
-        mock_context,
-        watsonx_client,
-        respx_mock,
+        ingestion_routes,
+        job_id,
+        mock_response,
+        expected,
     ):
-        """Test cancelling a running ingestion job."""
-        # 204 No Content response returns empty body, which becomes {"success": True}
-        respx_mock.delete("https://test.watsonx.com/api/v3/lhingestion/api/v1/ingestion/jobs/job-running").mock(
-            return_value=httpx.Response(204)
-        )
+        """Test successfully cancelling ingestion jobs."""
+        ingestion_routes["cancel"].mock(return_value=mock_response)
 
         result = await cancel_ingestion_job(
             mock_context,
-            job_id="job-running",
+            job_id=job_id,
         )
 
-        assert result["success"] is True
+        assert ingestion_routes["cancel"].calls.last.request.url.path.endswith(f"/jobs/{job_id}")
+        assert result == expected
 
-    @pytest.mark.asyncio
     async def test_cancel_nonexistent_job(
         self,
         mock_context,
         watsonx_client,
-        respx_mock,
+        ingestion_routes,
     ):
         """Test cancelling a non-existent ingestion job."""
-        respx_mock.delete("https://test.watsonx.com/api/v3/lhingestion/api/v1/ingestion/jobs/job-nonexistent").mock(
-            return_value=httpx.Response(404, json={"message": "Ingestion job not found"})
-        )
+        ingestion_routes["cancel"].mock(return_value=_JOB_NOT_FOUND_RESPONSE)
 
         result = await cancel_ingestion_job(
             mock_context,
             job_id="job-nonexistent",
         )
-        
+
         assert result["error"] is True
         assert "Ingestion job not found" in result["error_message"]
         assert result["status_code"] == 404
-
-    @pytest.mark.asyncio
-    async def test_cancel_completed_job(
-        self,
-        mock_context,
-        watsonx_client,
-        respx_mock,
-    ):
-        """Test cancelling a completed ingestion job."""
-        # 204 No Content response returns empty body, which becomes {"success": True}
-        respx_mock.delete("https://test.watsonx.com/api/v3/lhingestion/api/v1/ingestion/jobs/job-completed").mock(
-            return_value=httpx.Response(204)
-        )
-
-        result = await cancel_ingestion_job(
-            mock_context,
-            job_id="job-completed",
-        )
-
-        assert result["success"] is True
\ No newline at end of file